@@ -5,21 +5,43 @@ Run with: python3 app.py
 Then open: http://localhost:5002
 """
 
-from flask import Flask, jsonify, request, send_file
+import os
+import sys
+
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 from scraper import scrape_jobs, scrape_hackernews  # Import both scrapers
 
+# Add the repo root to the import path so "shared" can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared.static_assets import StaticAssets  # In-memory, pre-compressed pages
+from shared.rate_limit import RateLimit, ConcurrencyLimit  # Admission control
+from shared.profiling import init_profiling  # Opt-in request profiler
+
 # Create the Flask app
 app = Flask(__name__)
 CORS(app)  # Allow cross-origin requests
+init_profiling(app)  # Off unless PROFILE_DIR is set
+
+# Load the frontend into memory once at startup (reloaded on change in debug mode)
+pages = StaticAssets(os.path.dirname(os.path.abspath(__file__)), "index.html")
+
+# Every /api/ request scrapes a live website, so limit how often each client
+# can call them and how many scrapes run at the same time. The limit leaves
+# room for normal clicking around the page (10 at once, then one per second);
+# requests that would wait over 3 seconds for a free slot get a 429.
+scrape_rate = RateLimit(rate=1, burst=10)
+scrape_slots = ConcurrencyLimit(max_concurrent=4, latency_budget=3.0)
 
 # Serve the frontend HTML page
 @app.route("/")
 def home():
-    return send_file("index.html")
+    return pages.serve("index.html")
 
 # API endpoint that returns scraped jobs as JSON
 @app.route("/api/jobs")
+@scrape_rate.limit
+@scrape_slots.limit
 def get_jobs():
     # Get the optional search query from the URL: /api/jobs?q=python
     search_term = request.args.get("q", None)
@@ -37,6 +59,8 @@ def get_jobs():
 
 # API endpoint that returns Hacker News stories as JSON
 @app.route("/api/hackernews")
+@scrape_rate.limit
+@scrape_slots.limit
 def get_hackernews():
     # Get the optional search query and sort: /api/hackernews?q=python&sort=newest
     search_term = request.args.get("q", None)
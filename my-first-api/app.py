@@ -1,11 +1,23 @@
+import os
+import sys
+
 from flask import Flask, jsonify, request
 
+# Add the repo root to the import path so "shared" can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared.profiling import init_profiling
+from shared.storage import ShardedStore, current_owner
+
 # Create the Flask app
 app = Flask(__name__)
 
-# Our "database" (just a list for now)
-tasks = []
-task_id = 1
+# Turn on request profiling if PROFILE_DIR is set (off by default)
+init_profiling(app)
+
+# Our "database" - each user's tasks live in their own shard,
+# picked by the "X-User-Id" header (no header = the "default" user)
+# Note: the header is not checked — it splits data up for speed, it is NOT security
+store = ShardedStore()
 
 # Root endpoint - test if API is running
 @app.route('/')
@@ -23,6 +35,7 @@ def home():
 # GET all tasks
 @app.route('/tasks', methods=['GET'])
 def get_tasks():
+    tasks = store.list(current_owner())
     return jsonify({
         "tasks": tasks,
         "count": len(tasks)
@@ -31,21 +44,15 @@ def get_tasks():
 # CREATE a new task
 @app.route('/tasks', methods=['POST'])
 def create_task():
-    global task_id
-    
     # Get data from request
     data = request.get_json()
     
-    # Create new task
-    new_task = {
-        "id": task_id,
+    # Create new task in this user's shard
+    new_task = store.add(current_owner(), {
         "title": data.get("title"),
         "description": data.get("description", ""),
         "completed": False
-    }
-    
-    tasks.append(new_task)
-    task_id += 1
+    })
     
     return jsonify({
         "message": "Task created!",
@@ -56,7 +63,7 @@ def create_task():
 @app.route('/tasks/<int:id>', methods=['GET'])
 def get_task(id):
     # Find task by id
-    task = next((t for t in tasks if t['id'] == id), None)
+    task = store.get(current_owner(), id)
     
     if task:
         return jsonify(task)
@@ -66,13 +73,10 @@ def get_task(id):
 # DELETE a task
 @app.route('/tasks/<int:id>', methods=['DELETE'])
 def delete_task(id):
-    global tasks
-    
     # Find and remove task
-    task = next((t for t in tasks if t['id'] == id), None)
+    task = store.delete(current_owner(), id)
     
     if task:
-        tasks = [t for t in tasks if t['id'] != id]
         return jsonify({
             "message": "Task deleted!",
             "task": task
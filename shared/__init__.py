@@ -0,0 +1,4 @@
+"""
+Shared helpers used by more than one of the Flask apps in this repo.
+Each app adds the repo root to sys.path so it can import from here.
+"""
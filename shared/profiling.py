@@ -0,0 +1,150 @@
+"""
+On-Demand Request Profiling
+Samples the call stack of selected requests and writes the result in
+"collapsed stack" format — one line per stack, e.g.
+
+    wsgi_app;get_hackernews;scrape_hackernews;find_all 42
+
+which flamegraph.pl, speedscope or inferno can turn into a flame graph.
+
+Nothing is profiled unless turned on. Settings come from app.config, or
+from environment variables with the same name:
+
+    PROFILE_DIR          Folder to write .collapsed files to (required)
+    PROFILE_SAMPLE_RATE  Fraction of requests to profile, 0.0 - 1.0 (default 0)
+    PROFILE_ADMIN_TOKEN  Profile any request sent with "X-Profile: <token>"
+    PROFILE_INTERVAL     Seconds between stack samples (default 0.001)
+
+Usage:
+    init_profiling(app)
+"""
+
+import hmac  # For comparing the admin token safely
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import g, request
+
+# Header an admin can send to profile one specific request
+PROFILE_HEADER = "X-Profile"
+
+
+def _frame_name(code):
+    # e.g. "scrape_hackernews (scraper.py:112)"
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """A background thread that records what one other thread is doing, every few ms."""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()  # "root;...;leaf" -> number of samples
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            # Walk from the innermost call outwards, then flip to root-first
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            names.reverse()
+            self.stacks[";".join(names)] += 1
+
+    def write(self, path):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def _should_profile(app):
+    token = app.config["PROFILE_ADMIN_TOKEN"]
+    header = request.headers.get(PROFILE_HEADER)
+    # Compare bytes: compare_digest raises TypeError on non-ASCII str, and a
+    # strange header must just count as "not the admin token"
+    if token and header and hmac.compare_digest(
+        header.encode("utf-8", "surrogateescape"), token.encode("utf-8", "surrogateescape")
+    ):
+        return True
+    return random.random() < app.config["PROFILE_SAMPLE_RATE"]
+
+
+def _output_path(directory, status):
+    # e.g. "20261019-142501-123456-GET-api_hackernews-200.collapsed"
+    stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{time.time_ns() // 1000 % 1000000:06d}"
+    route = re.sub(r"[^A-Za-z0-9]+", "_", request.path).strip("_") or "root"
+    return os.path.join(directory, f"{stamp}-{request.method}-{route}-{status}.collapsed")
+
+
+def init_profiling(app):
+    """Register the before/after hooks that profile selected requests."""
+    app.config.setdefault("PROFILE_DIR", os.environ.get("PROFILE_DIR"))
+    app.config.setdefault(
+        "PROFILE_SAMPLE_RATE", float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+    )
+    app.config.setdefault("PROFILE_ADMIN_TOKEN", os.environ.get("PROFILE_ADMIN_TOKEN"))
+    app.config.setdefault(
+        "PROFILE_INTERVAL", float(os.environ.get("PROFILE_INTERVAL", 0.001))
+    )
+
+    @app.before_request
+    def start_profiling():
+        if not app.config["PROFILE_DIR"] or not _should_profile(app):
+            return
+        sampler = StackSampler(threading.get_ident(), app.config["PROFILE_INTERVAL"])
+        sampler.start()
+        g.profile_sampler = sampler
+
+    @app.after_request
+    def stop_profiling(response):
+        sampler = g.pop("profile_sampler", None)
+        if sampler is None:
+            return response
+
+        sampler.stop()
+
+        # Requests shorter than PROFILE_INTERVAL finish before the first
+        # sample, so there is nothing worth writing
+        if not sampler.stacks:
+            return response
+
+        # A diagnostics hook must never fail the request it observed, so an
+        # unwritable folder or a full disk only gets a warning in the log
+        directory = app.config["PROFILE_DIR"]
+        path = _output_path(directory, response.status_code)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            sampler.write(path)
+        except OSError as err:
+            app.logger.warning("Could not write profile to %s: %s", path, err)
+            return response
+
+        app.logger.info("Wrote profile for %s %s to %s", request.method, request.path, path)
+        return response
+
+    @app.teardown_request
+    def cleanup_profiling(error):
+        # after_request is skipped when an error propagates (e.g. in debug
+        # mode), so make sure the sampler thread never outlives its request
+        sampler = g.pop("profile_sampler", None)
+        if sampler is not None:
+            sampler.stop()
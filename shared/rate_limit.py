@@ -0,0 +1,147 @@
+"""
+Admission Control
+Protects expensive endpoints from bursts of traffic. Two pieces that can
+be stacked on any route:
+
+- RateLimit: a token bucket per client (by IP address). Each request takes
+  a token; tokens refill at a steady rate. An empty bucket means 429.
+- ConcurrencyLimit: a global cap on how many requests run at once. Extra
+  requests wait in line, but if the line is already too long to finish
+  within the latency budget they are turned away right away with 429.
+
+Usage:
+    scrape_rate = RateLimit(rate=1, burst=5)
+    scrape_slots = ConcurrencyLimit(max_concurrent=4, latency_budget=2.0)
+
+    @app.route("/api/jobs")
+    @scrape_rate.limit
+    @scrape_slots.limit
+    def get_jobs():
+        ...
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import jsonify, request
+
+
+def too_many_requests(retry_after):
+    """Build a 429 response telling the client how many seconds to wait."""
+    response = jsonify({"error": "Too many requests, please slow down"})
+    response.status_code = 429
+    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+class RateLimit:
+    """Per-client token buckets: `burst` requests at once, then `rate` per second."""
+
+    # Track at most this many clients. When a new client arrives and the table
+    # is full, the one that made a request longest ago is forgotten (it starts
+    # again with a full bucket if it comes back), so memory stays bounded
+    MAX_CLIENTS = 10000
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        # client key -> [tokens left, time of last refill], least recently used first
+        self._buckets = OrderedDict()
+
+    def _client_key(self):
+        return request.remote_addr or "unknown"
+
+    def take(self):
+        """Take a token for the current client. Returns 0 on success, else seconds to wait."""
+        key = self._client_key()
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.MAX_CLIENTS:
+                    self._buckets.popitem(last=False)  # O(1): drop the least recent client
+                bucket = [self.burst, now]
+                self._buckets[key] = bucket
+            else:
+                self._buckets.move_to_end(key)  # Mark as most recently seen
+
+            # Refill for the time that has passed, but never above the burst size
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return 0
+
+            bucket[0] = tokens
+            # How long until one whole token has built up again
+            return (1 - tokens) / self.rate
+
+    def limit(self, view):
+        """Decorator: reject the request with 429 when the client's bucket is empty."""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            retry_after = self.take()
+            if retry_after:
+                return too_many_requests(retry_after)
+            return view(*args, **kwargs)
+        return wrapper
+
+
+class ConcurrencyLimit:
+    """Global cap on requests in flight, shedding load that would wait too long."""
+
+    def __init__(self, max_concurrent, latency_budget):
+        self.max_concurrent = max_concurrent
+        self.latency_budget = latency_budget  # Max seconds a request may wait for a slot
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        # Moving average of how long one request takes, to estimate queue time
+        self._avg_duration = 0.0
+
+    def _estimated_wait(self):
+        # Everyone ahead of us shares max_concurrent slots
+        return (self._waiting + 1) / self.max_concurrent * self._avg_duration
+
+    def _record(self, duration):
+        with self._lock:
+            if self._avg_duration == 0.0:
+                self._avg_duration = duration
+            else:
+                self._avg_duration = 0.8 * self._avg_duration + 0.2 * duration
+
+    def limit(self, view):
+        """Decorator: run the view in a free slot, or return 429 if none frees up in time."""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Fast path: a slot is free right now
+            acquired = self._slots.acquire(blocking=False)
+
+            if not acquired:
+                with self._lock:
+                    estimate = self._estimated_wait()
+                    if estimate > self.latency_budget:
+                        # The line is already too long — fail fast instead of queueing
+                        return too_many_requests(estimate)
+                    self._waiting += 1
+                try:
+                    acquired = self._slots.acquire(timeout=self.latency_budget)
+                finally:
+                    with self._lock:
+                        self._waiting -= 1
+                if not acquired:
+                    return too_many_requests(self.latency_budget)
+
+            start = time.monotonic()
+            try:
+                return view(*args, **kwargs)
+            finally:
+                self._record(time.monotonic() - start)
+                self._slots.release()
+        return wrapper
@@ -0,0 +1,124 @@
+"""
+In-Memory Static Assets
+Loads HTML pages into memory once at startup and serves them from RAM.
+Each page is compressed ahead of time (gzip, plus brotli if installed),
+so a page load is just a memory copy instead of a disk read + compression.
+
+Pages are served at fixed URLs like "/", so they can't be cached forever.
+Instead every response carries a strong ETag and "Cache-Control: no-cache":
+the browser keeps its copy and gets a tiny 304 when nothing has changed.
+
+Usage:
+    assets = StaticAssets(os.path.dirname(__file__), "index.html")
+
+    @app.route("/")
+    def home():
+        return assets.serve("index.html")
+"""
+
+import gzip  # Built-in compression that every browser understands
+import hashlib  # For fingerprinting file contents (used as the ETag)
+import mimetypes  # Guesses "text/html" etc. from the file name
+import os
+import threading
+
+from flask import Response, current_app, request
+
+# Brotli compresses HTML better than gzip, but it's an extra install
+# (pip3 install brotli). If it's missing we just skip the brotli variant.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# The browser keeps a copy but must check the ETag first, which costs a
+# tiny 304 response when nothing changed
+CACHE_CONTROL = "no-cache"
+
+
+class _Asset:
+    """One file loaded into memory, with all of its encoded variants."""
+
+    def __init__(self, path):
+        self.path = path
+        self.mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        # Stat BEFORE reading: if the file changes while we read it, the next
+        # mtime check sees a newer value and loads it again
+        self.mtime = os.stat(path).st_mtime_ns
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        # A short hash of the contents — changes whenever the file changes
+        self.fingerprint = hashlib.sha256(raw).hexdigest()[:16]
+
+        # encoding name -> (body bytes, strong ETag)
+        # Every variant gets its own ETag because the bytes are different
+        self.variants = {"identity": (raw, self.fingerprint)}
+
+        gzipped = gzip.compress(raw, compresslevel=9, mtime=0)
+        if len(gzipped) < len(raw):
+            self.variants["gzip"] = (gzipped, self.fingerprint + "-gzip")
+
+        if brotli is not None:
+            brotlied = brotli.compress(raw, quality=11)
+            if len(brotlied) < len(raw):
+                self.variants["br"] = (brotlied, self.fingerprint + "-br")
+
+
+class StaticAssets:
+    """A set of files from one directory, served from memory."""
+
+    def __init__(self, directory, *filenames):
+        self.directory = directory
+        self._lock = threading.Lock()  # Only one thread reloads a file at a time
+        self._assets = {}
+        for filename in filenames:
+            self._assets[filename] = _Asset(os.path.join(directory, filename))
+
+    def _get(self, filename):
+        asset = self._assets[filename]
+
+        # In debug mode, pick up edits without restarting the server.
+        # A stat() is much cheaper than re-reading and re-compressing.
+        if current_app.debug:
+            try:
+                changed = os.stat(asset.path).st_mtime_ns != asset.mtime
+            except OSError:
+                changed = False  # File is mid-save or gone — keep the old copy
+            if changed:
+                with self._lock:
+                    # Another thread may have reloaded it while we waited
+                    asset = self._assets[filename]
+                    try:
+                        if os.stat(asset.path).st_mtime_ns != asset.mtime:
+                            asset = _Asset(asset.path)
+                            self._assets[filename] = asset
+                    except OSError:
+                        pass  # File vanished mid-save (delete-then-rename) — keep the old copy
+
+        return asset
+
+    def serve(self, filename):
+        """Build a response for the file, picking the best encoding for this browser."""
+        asset = self._get(filename)
+
+        # Pick the smallest encoding the browser says it accepts
+        encoding = request.accept_encodings.best_match(
+            [name for name in ("br", "gzip") if name in asset.variants]
+        ) or "identity"
+        body, etag = asset.variants[encoding]
+
+        # If the browser already has this exact version, send 304 Not Modified
+        if etag in request.if_none_match:
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype=asset.mimetype)
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = CACHE_CONTROL
+        # Tell caches that the body depends on the Accept-Encoding header
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
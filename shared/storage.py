@@ -0,0 +1,233 @@
+"""
+Per-User Storage
+Keeps each user's items (todos, tasks, ...) in their own shard, with its
+own dictionary index and its own lock. One user's requests only ever
+touch their shard: lookups are a dict access instead of a scan over
+everybody's items, and listing copies only that user's items.
+
+Most of the speedup over the old single list comes from the dict index.
+Splitting into per-user shards and locks adds only a small gain on top
+(roughly 1.0-1.3x with 1-64 users in the benchmark, within noise at low
+user counts), because Python's GIL already lets only one thread run at
+a time, so users rarely wait on each other's lock for long.
+
+The user is picked with the "X-User-Id" request header. Requests without
+it all share the "default" user, so single-user clients keep working.
+This header only partitions data for performance. It is NOT access
+control: anyone can read or delete another user's items by sending
+their id.
+
+Reads never create a shard, so requests for unknown users cost nothing.
+Only add() creates one.
+
+Usage:
+    store = ShardedStore()
+
+    @app.route("/todos/<int:todo_id>")
+    def get_todo(todo_id):
+        todo = store.get(current_owner(), todo_id)
+
+Run the multi-user benchmark with: python3 -m shared.storage
+"""
+
+import threading
+import time
+
+from flask import request
+
+# Header that says which user a request belongs to
+OWNER_HEADER = "X-User-Id"
+DEFAULT_OWNER = "default"
+
+
+def current_owner():
+    """Return the user id for the current request."""
+    return request.headers.get(OWNER_HEADER) or DEFAULT_OWNER
+
+
+class Shard:
+    """One user's items, indexed by id and guarded by the user's own lock."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}  # id -> item (dicts keep insertion order, so listing stays in creation order)
+        self._next_id = 1
+
+    def list(self):
+        """Return copies of all items, oldest first."""
+        with self._lock:
+            return [dict(item) for item in self._items.values()]
+
+    def get(self, item_id):
+        """Return a copy of the item, or None if it doesn't exist."""
+        with self._lock:
+            item = self._items.get(item_id)
+            return dict(item) if item is not None else None
+
+    def add(self, fields):
+        """Store a new item with the next free id and return a copy of it."""
+        with self._lock:
+            item = {"id": self._next_id, **fields}
+            self._items[self._next_id] = item
+            self._next_id += 1
+            return dict(item)
+
+    def update(self, item_id, changes):
+        """Apply the changes to an item and return a copy, or None if it doesn't exist."""
+        with self._lock:
+            item = self._items.get(item_id)
+            if item is None:
+                return None
+            item.update(changes)
+            return dict(item)
+
+    def delete(self, item_id):
+        """Remove an item and return it, or None if it doesn't exist."""
+        with self._lock:
+            return self._items.pop(item_id, None)
+
+
+class ShardedStore:
+    """All users' shards. A shard is created the first time a user adds an item."""
+
+    def __init__(self):
+        self._lock = threading.Lock()  # Only held while creating a new shard
+        self._shards = {}
+
+    def find(self, owner):
+        """Return the user's shard, or None if they have never added anything."""
+        return self._shards.get(owner)
+
+    def shard(self, owner):
+        """Return the user's shard, creating it if needed."""
+        shard = self._shards.get(owner)
+        if shard is None:
+            with self._lock:
+                # Another thread may have created it while we waited
+                shard = self._shards.setdefault(owner, Shard())
+        return shard
+
+    def list(self, owner):
+        shard = self.find(owner)
+        return shard.list() if shard is not None else []
+
+    def get(self, owner, item_id):
+        shard = self.find(owner)
+        return shard.get(item_id) if shard is not None else None
+
+    def add(self, owner, fields):
+        return self.shard(owner).add(fields)
+
+    def update(self, owner, item_id, changes):
+        shard = self.find(owner)
+        return shard.update(item_id, changes) if shard is not None else None
+
+    def delete(self, owner, item_id):
+        shard = self.find(owner)
+        return shard.delete(item_id) if shard is not None else None
+
+
+# ============================================================
+# BENCHMARK: one shared list vs one shared dict vs one shard per user
+# ============================================================
+
+class _GlobalListStore:
+    """The old approach: every user's items in one list behind one lock."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = []
+        self._next_id = 1
+
+    def add(self, owner, fields):
+        with self._lock:
+            item = {"id": self._next_id, "owner": owner, **fields}
+            self._items.append(item)
+            self._next_id += 1
+            return item
+
+    def get(self, owner, item_id):
+        with self._lock:
+            for item in self._items:
+                if item["id"] == item_id and item["owner"] == owner:
+                    return dict(item)
+            return None
+
+    def update(self, owner, item_id, changes):
+        with self._lock:
+            for item in self._items:
+                if item["id"] == item_id and item["owner"] == owner:
+                    item.update(changes)
+                    return dict(item)
+            return None
+
+
+class _GlobalDictStore:
+    """Indexed but not sharded: every user's items in one dict behind one lock.
+
+    Comparing against this isolates what splitting into shards adds, on top
+    of just replacing the scan with a dict lookup.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}  # (owner, id) -> item
+        self._next_id = 1
+
+    def add(self, owner, fields):
+        with self._lock:
+            item = {"id": self._next_id, **fields}
+            self._items[(owner, self._next_id)] = item
+            self._next_id += 1
+            return dict(item)
+
+    def get(self, owner, item_id):
+        with self._lock:
+            item = self._items.get((owner, item_id))
+            return dict(item) if item is not None else None
+
+    def update(self, owner, item_id, changes):
+        with self._lock:
+            item = self._items.get((owner, item_id))
+            if item is None:
+                return None
+            item.update(changes)
+            return dict(item)
+
+
+def _benchmark(store, users, items_per_user, ops_per_user):
+    # Fill the store so lookups have something to search through
+    ids = {}
+    for user in range(users):
+        ids[user] = [store.add(user, {"title": "todo", "done": False})["id"]
+                     for _ in range(items_per_user)]
+
+    def work(user):
+        user_ids = ids[user]
+        for i in range(ops_per_user):
+            item_id = user_ids[i % len(user_ids)]
+            store.get(user, item_id)
+            store.update(user, item_id, {"done": i % 2 == 0})
+
+    threads = [threading.Thread(target=work, args=(user,)) for user in range(users)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return users * ops_per_user * 2 / elapsed  # operations per second
+
+
+if __name__ == "__main__":
+    print("Multi-user benchmark (get + update per op, one thread per user)")
+    print("'sharding gain' compares sharded against the indexed global dict\n")
+    print(f"{'users':>6} {'global list ops/s':>18} {'global dict ops/s':>18} "
+          f"{'sharded ops/s':>15} {'sharding gain':>14}")
+    for users in (1, 4, 16, 64):
+        kwargs = {"users": users, "items_per_user": 200, "ops_per_user": 2000}
+        scan = _benchmark(_GlobalListStore(), **kwargs)
+        indexed = _benchmark(_GlobalDictStore(), **kwargs)
+        sharded = _benchmark(ShardedStore(), **kwargs)
+        print(f"{users:>6} {scan:>18,.0f} {indexed:>18,.0f} "
+              f"{sharded:>15,.0f} {sharded / indexed:>13.2f}x")
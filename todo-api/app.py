@@ -4,44 +4,63 @@ from flask import Flask, request, jsonify
 # Import CORS to allow the frontend (HTML file) to talk to the API
 from flask_cors import CORS
 
+# Import os and sys so we can find the shared helpers one folder up
+import os
+import sys
+
+# Add the repo root to the import path so "shared" can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# Import the per-client rate limiter to protect the write endpoints
+from shared.rate_limit import RateLimit
+
+# Import the opt-in request profiler (see shared/profiling.py for settings)
+from shared.profiling import init_profiling
+
+# Import per-user storage — each user's todos live in their own shard
+from shared.storage import ShardedStore, current_owner
+
 # Create an instance of the Flask app — this is the core of your API
 app = Flask(__name__)
 
 # Enable CORS so the browser doesn't block requests from the frontend
 CORS(app)
 
-# A list to store our todos in memory (resets when the server restarts)
-todos = []
+# Turn on request profiling if PROFILE_DIR is set (off by default)
+init_profiling(app)
 
-# A counter to give each todo a unique ID
-next_id = 1
+# Each client may make 20 writes in a burst, then 5 per second after that
+write_limit = RateLimit(rate=5, burst=20)
 
+# Store todos in memory, one shard per user (resets when the server restarts)
+# The user comes from the "X-User-Id" header; without it, everyone shares "default"
+# Note: the header is not checked — it splits data up for speed, it is NOT security
+store = ShardedStore()
 
-# Define a route for GET /todos — this returns all todos
+
+# Define a route for GET /todos — this returns all of the user's todos
 @app.route("/todos", methods=["GET"])
 def get_todos():
-    # Return the full list of todos as JSON with a 200 OK status
-    return jsonify(todos), 200
+    # Return the user's todos as JSON with a 200 OK status
+    return jsonify(store.list(current_owner())), 200
 
 
 # Define a route for GET /todos/<id> — this returns a single todo by its ID
 @app.route("/todos/<int:todo_id>", methods=["GET"])
 def get_todo(todo_id):
-    # Loop through all todos to find the one with the matching ID
-    for todo in todos:
-        if todo["id"] == todo_id:
-            # Found it — return it as JSON
-            return jsonify(todo), 200
-    # If no todo matched, return a 404 Not Found error
-    return jsonify({"error": "Todo not found"}), 404
+    # Look the todo up by its ID in this user's shard
+    todo = store.get(current_owner(), todo_id)
+    if todo is None:
+        # If no todo matched, return a 404 Not Found error
+        return jsonify({"error": "Todo not found"}), 404
+    # Found it — return it as JSON
+    return jsonify(todo), 200
 
 
 # Define a route for POST /todos — this creates a new todo
 @app.route("/todos", methods=["POST"])
+@write_limit.limit
 def create_todo():
-    # We need access to the global next_id variable so we can update it
-    global next_id
-
     # Get the JSON data sent in the request body
     data = request.get_json()
 
@@ -50,18 +69,11 @@ def create_todo():
         # If not, return a 400 Bad Request error
         return jsonify({"error": "Title is required"}), 400
 
-    # Build a new todo dictionary with an ID, title, and done status
-    todo = {
-        "id": next_id,                       # Assign the current ID counter
+    # Add the todo to this user's shard — it gets the user's next unique ID
+    todo = store.add(current_owner(), {
         "title": data["title"],              # Use the title from the request
         "done": data.get("done", False),     # Default "done" to False if not provided
-    }
-
-    # Increment the ID counter so the next todo gets a unique ID
-    next_id += 1
-
-    # Add the new todo to our list
-    todos.append(todo)
+    })
 
     # Return the created todo as JSON with a 201 Created status
     return jsonify(todo), 201
@@ -69,37 +81,32 @@ def create_todo():
 
 # Define a route for PUT /todos/<id> — this updates an existing todo
 @app.route("/todos/<int:todo_id>", methods=["PUT"])
+@write_limit.limit
 def update_todo(todo_id):
     # Get the JSON data sent in the request body
-    data = request.get_json()
+    data = request.get_json() or {}
 
-    # Loop through all todos to find the one with the matching ID
-    for todo in todos:
-        if todo["id"] == todo_id:
-            # Update the title if provided, otherwise keep the current title
-            todo["title"] = data.get("title", todo["title"])
-            # Update the done status if provided, otherwise keep the current value
-            todo["done"] = data.get("done", todo["done"])
-            # Return the updated todo as JSON
-            return jsonify(todo), 200
+    # Only change the fields that were provided, keep the rest as they are
+    changes = {key: data[key] for key in ("title", "done") if key in data}
+    todo = store.update(current_owner(), todo_id, changes)
 
-    # If no todo matched, return a 404 Not Found error
-    return jsonify({"error": "Todo not found"}), 404
+    if todo is None:
+        # If no todo matched, return a 404 Not Found error
+        return jsonify({"error": "Todo not found"}), 404
+    # Return the updated todo as JSON
+    return jsonify(todo), 200
 
 
 # Define a route for DELETE /todos/<id> — this deletes a todo
 @app.route("/todos/<int:todo_id>", methods=["DELETE"])
+@write_limit.limit
 def delete_todo(todo_id):
-    # Loop through all todos to find the one with the matching ID
-    for i, todo in enumerate(todos):
-        if todo["id"] == todo_id:
-            # Remove the todo from the list using its index
-            todos.pop(i)
-            # Return a success message
-            return jsonify({"message": "Todo deleted"}), 200
-
-    # If no todo matched, return a 404 Not Found error
-    return jsonify({"error": "Todo not found"}), 404
+    # Remove the todo from this user's shard
+    if store.delete(current_owner(), todo_id) is None:
+        # If no todo matched, return a 404 Not Found error
+        return jsonify({"error": "Todo not found"}), 404
+    # Return a success message
+    return jsonify({"message": "Todo deleted"}), 200
 
 
 # This block runs only when you execute this file directly (not when imported)
@@ -1,5 +1,5 @@
 # Import the Flask class and helper functions from the flask library
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify
 
 # Import CORS to allow the frontend (HTML file) to talk to the API
 from flask_cors import CORS
@@ -10,12 +10,37 @@ from datetime import date
 # Import random to pick a random motivational image
 import random
 
+# Import os and sys so we can find the shared helpers one folder up
+import os
+import sys
+
+# Add the repo root to the import path so "shared" can be imported
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# Import the helper that keeps our HTML pages in memory, pre-compressed
+from shared.static_assets import StaticAssets
+
+# Import the per-client rate limiter to protect the write endpoints
+from shared.rate_limit import RateLimit
+
+# Import the opt-in request profiler (see shared/profiling.py for settings)
+from shared.profiling import init_profiling
+
 # Create an instance of the Flask app — this is the core of your API
 app = Flask(__name__)
 
 # Enable CORS so the browser doesn't block requests from the frontend
 CORS(app)
 
+# Turn on request profiling if PROFILE_DIR is set (off by default)
+init_profiling(app)
+
+# Load the HTML pages into memory once at startup (reloaded on change in debug mode)
+pages = StaticAssets(os.path.dirname(os.path.abspath(__file__)), "index.html", "workouts.html")
+
+# Each client may make 20 writes in a burst, then 5 per second after that
+write_limit = RateLimit(rate=5, burst=20)
+
 # A list of motivational fitness image URLs (from Unsplash)
 motivational_images = [
     {
@@ -82,15 +107,15 @@ next_id = 1
 # Define a route for the landing page — serves index.html
 @app.route("/")
 def serve_landing():
-    # Send the index.html file from the same directory as this script
-    return send_from_directory(".", "index.html")
+    # Send the in-memory copy of index.html
+    return pages.serve("index.html")
 
 
 # Define a route for the workouts page — serves workouts.html
 @app.route("/log")
 def serve_workouts():
-    # Send the workouts.html file from the same directory as this script
-    return send_from_directory(".", "workouts.html")
+    # Send the in-memory copy of workouts.html
+    return pages.serve("workouts.html")
 
 
 # Define a route for GET /workouts — this returns all workouts
@@ -114,6 +139,7 @@ def get_workout(workout_id):
 
 # Define a route for POST /workouts — this logs a new workout
 @app.route("/workouts", methods=["POST"])
+@write_limit.limit
 def create_workout():
     # We need access to the global next_id variable so we can update it
     global next_id
@@ -150,6 +176,7 @@ def create_workout():
 
 # Define a route for PUT /workouts/<id> — this updates an existing workout
 @app.route("/workouts/<int:workout_id>", methods=["PUT"])
+@write_limit.limit
 def update_workout(workout_id):
     # Get the JSON data sent in the request body
     data = request.get_json()
@@ -173,6 +200,7 @@ def update_workout(workout_id):
 
 # Define a route for DELETE /workouts/<id> — this deletes a workout
 @app.route("/workouts/<int:workout_id>", methods=["DELETE"])
+@write_limit.limit
 def delete_workout(workout_id):
     # Loop through all workouts to find the one with the matching ID
     for i, workout in enumerate(workouts):